@@ -1,17 +1,18 @@
 #!/usr/bin/env python
-import itertools
+import functools
 import re
 from contextlib import contextmanager
 from gettext import NullTranslations
 from typing import (
     TYPE_CHECKING,
     Any,
-    Callable,
+    Container,
     Dict,
     Iterable,
     List,
     NamedTuple,
     Optional,
+    Pattern,
     Set,
     Tuple,
     Union,
@@ -21,7 +22,7 @@ from typing import (
 
 from asgiref.local import Local
 from django.utils.encoding import force_str
-from django.utils.translation import override, trans_real
+from django.utils.translation import get_language, override, trans_real
 from typing_extensions import Literal, TypedDict
 
 from django_countries.conf import settings
@@ -34,23 +35,40 @@ if TYPE_CHECKING:
 try:
     import pyuca  # type: ignore
 
-    collator = pyuca.Collator()
+    @functools.lru_cache(maxsize=None)
+    def _get_collator() -> Any:
+        # Building the collator loads the whole collation table which is
+        # fairly slow, so don't do it until something actually gets sorted.
+        return pyuca.Collator()
 
     # Use UCA sorting if it's available.
-    def sort_key(item: Tuple[str, str]) -> Any:
-        return collator.sort_key(item[1])
+    def _collation_key(name: str) -> Any:
+        return _get_collator().sort_key(name)
 
 except ImportError:
     # Fallback if the UCA sorting is not available.
     import unicodedata
 
-    # Cheap and dirty method to sort against ASCII characters only.
-    def sort_key(item: Tuple[str, str]) -> Any:
-        return (
-            unicodedata.normalize("NFKD", item[1])
-            .encode("ascii", "ignore")
-            .decode("ascii")
-        )
+    # Cheap and dirty method to sort against ASCII characters only. The
+    # encoded bytes are used directly as the key since they compare the same
+    # as the decoded string would.
+    def _collation_key(name: str) -> Any:
+        if name.isascii():
+            # Most names are already plain ASCII, so skip normalizing them.
+            return name.encode("ascii")
+        return unicodedata.normalize("NFKD", name).encode("ascii", "ignore")
+
+
+@functools.lru_cache(maxsize=2048)
+def _name_sort_key(name: str) -> Any:
+    # Generating a sort key is relatively slow (especially with pyuca) and the
+    # same names get sorted again for each language, set of options and
+    # Countries instance, so remember them.
+    return _collation_key(name)
+
+
+def sort_key(item: Tuple[str, str]) -> Any:
+    return _name_sort_key(item[1])
 
 
 _translation_state = Local()
@@ -123,6 +141,9 @@ class Countries(CountriesBase):
 
     _countries: Dict[str, CountryName]
     _alt_codes: Dict[str, AltCodes]
+    _alpha3_index: Dict[str, str]
+    _numeric_index: Dict[int, str]
+    _complex_codes: List[str]
 
     def get_option(self, option: str):
         """
@@ -162,18 +183,18 @@ class Countries(CountriesBase):
                 # until first used.
                 from django_countries.data import COUNTRIES
 
-                countries_dict = dict(COUNTRIES)
                 if only:
                     self._countries = {}
                     for item in only:
                         if isinstance(item, str):
-                            self._countries[item] = countries_dict[item]
+                            self._countries[item] = COUNTRIES[item]
                         else:
                             key, value = item
                             self._countries[key] = value
                 else:
-                    self._countries = countries_dict.copy()  # type: ignore
-                if self.get_option("common_names"):
+                    self._countries = dict(COUNTRIES)  # type: ignore
+                common_names = self.get_option("common_names")
+                if common_names:
                     for code, name in self.COMMON_NAMES.items():
                         if code in self._countries:
                             self._countries[code] = name
@@ -181,25 +202,39 @@ class Countries(CountriesBase):
                     "override"
                 )
                 if override:
+                    # self._countries is already a new dict, so it's safe to
+                    # update in place (then remove any countries overridden
+                    # with None).
                     _countries = cast(
-                        Dict[str, Union[CountryName, None]], self._countries.copy()
+                        Dict[str, Union[CountryName, None]], self._countries
                     )
                     _countries.update(override)
-                    self._countries = {
-                        code: name
-                        for code, name in _countries.items()
-                        if name is not None
-                    }
+                    for code, override_name in override.items():
+                        if override_name is None:
+                            del _countries[code]
 
-                if self.get_option("common_names"):
+                if common_names:
                     for code in self.COMMON_NAMES:
                         if code in self._countries and code not in override:
-                            self._shadowed_names[code] = [countries_dict[code]]
+                            self._shadowed_names[code] = [COUNTRIES[code]]
                 for code, names in self.OLD_NAMES.items():
                     if code in self._countries and code not in override:
                         country_shadowed = self._shadowed_names.setdefault(code, [])
                         country_shadowed.extend(names)
 
+            # Codes of countries defined with a dict (ComplexCountryName) so the
+            # alternate code properties don't need to check every country.
+            self._complex_codes = [
+                code
+                for code, country in self._countries.items()
+                if isinstance(country, dict)
+            ]
+            self._iter_cache: Dict[Tuple, List[CountryTuple]] = {}
+            self._names_cache: Dict[str, List[Tuple[str, str]]] = {}
+            self._name_index_cache: Dict[Tuple[str, bool], Dict[str, str]] = {}
+
+            # Resolving first countries may need the alternate codes (built
+            # from the complex codes above), so this needs to happen last.
             self.countries_first = []
             first: List[str] = self.get_option("first") or []
             for code in first:
@@ -219,10 +254,22 @@ class Countries(CountriesBase):
             del self._countries
         if hasattr(self, "_alt_codes"):
             del self._alt_codes
+        if hasattr(self, "_alpha3_index"):
+            del self._alpha3_index
+        if hasattr(self, "_numeric_index"):
+            del self._numeric_index
         if hasattr(self, "_ioc_codes"):
             del self._ioc_codes
         if hasattr(self, "_shadowed_names"):
             del self._shadowed_names
+        if hasattr(self, "_complex_codes"):
+            del self._complex_codes
+        if hasattr(self, "_iter_cache"):
+            del self._iter_cache
+        if hasattr(self, "_names_cache"):
+            del self._names_cache
+        if hasattr(self, "_name_index_cache"):
+            del self._name_index_cache
 
     @property
     def alt_codes(self) -> Dict[str, AltCodes]:
@@ -232,10 +279,10 @@ class Countries(CountriesBase):
 
             self._alt_codes = ALT_CODES  # type: ignore
             altered = False
-            for code, country in self.countries.items():
-                if isinstance(country, dict) and (
-                    "alpha3" in country or "numeric" in country
-                ):
+            countries = self.countries
+            for code in self._complex_codes:
+                country = cast(ComplexCountryName, countries[code])
+                if "alpha3" in country or "numeric" in country:
                     if not altered:
                         self._alt_codes = self._alt_codes.copy()
                         altered = True
@@ -247,6 +294,29 @@ class Countries(CountriesBase):
                     self._alt_codes[code] = AltCodes(alpha3, numeric)
         return self._alt_codes
 
+    @property
+    def alpha3_index(self) -> Dict[str, str]:
+        """
+        A mapping of ISO 3166-1 three letter codes to their two letter code.
+        """
+        if not hasattr(self, "_alpha3_index"):
+            self._alpha3_index = {}
+            for code, alt_codes in self.alt_codes.items():
+                self._alpha3_index.setdefault(alt_codes[0], code)
+        return self._alpha3_index
+
+    @property
+    def numeric_index(self) -> Dict[int, str]:
+        """
+        A mapping of ISO 3166-1 numeric codes to their two letter code.
+        """
+        if not hasattr(self, "_numeric_index"):
+            self._numeric_index = {}
+            for code, alt_codes in self.alt_codes.items():
+                if alt_codes[1] is not None:
+                    self._numeric_index.setdefault(alt_codes[1], code)
+        return self._numeric_index
+
     @property
     def ioc_codes(self) -> Dict[str, str]:
         if not hasattr(self, "_ioc_codes"):
@@ -254,8 +324,10 @@ class Countries(CountriesBase):
 
             self._ioc_codes = ISO_TO_IOC
             altered = False
-            for code, country in self.countries.items():
-                if isinstance(country, dict) and "ioc_code" in country:
+            countries = self.countries
+            for code in self._complex_codes:
+                country = cast(ComplexCountryName, countries[code])
+                if "ioc_code" in country:
                     if not altered:
                         self._ioc_codes = self._ioc_codes.copy()
                         altered = True
@@ -269,18 +341,11 @@ class Countries(CountriesBase):
             self.countries
         return self._shadowed_names
 
-    def translate_code(self, code: str, ignore_first: Optional[List[str]] = None):
+    def translate_code(self, code: str, ignore_first: Optional[Container[str]] = None):
         """
         Return translated countries for a country code.
         """
-        country = self.countries[code]
-        if isinstance(country, dict):
-            if "names" in country:
-                names = country["names"]
-            else:
-                names = [country["name"]]
-        else:
-            names = [country]
+        names = self._country_names(self.countries[code])
         if ignore_first and code in ignore_first:
             names = names[1:]
         for name in names:
@@ -338,32 +403,50 @@ class Countries(CountriesBase):
         The first countries can be separated from the sorted list by the
         value provided in ``settings.COUNTRIES_FIRST_BREAK``.
         """
+        return iter(self._sorted_list())
+
+    def _sorted_list(self) -> List[CountryTuple]:
+        """
+        Return the (cached) list of countries that iterating this object
+        provides.
+        """
         # Initializes countries_first, so needs to happen first.
         countries = self.countries
 
-        # Yield countries that should be displayed first.
-        countries_first = (self.translate_pair(code) for code in self.countries_first)
-
-        if self.get_option("first_sort"):
-            countries_first = sorted(countries_first, key=sort_key)
-
-        yield from countries_first
-
-        if self.countries_first:
-            first_break = self.get_option("first_break")
-            if first_break:
-                yield CountryTuple("", force_str(first_break))
-
-        # Force translation before sorting.
-        ignore_first = None if self.get_option("first_repeat") else self.countries_first
-        countries = tuple(
-            itertools.chain.from_iterable(
-                self.translate_code(code, ignore_first) for code in countries
-            )
-        )
-
-        # Return sorted country list.
-        yield from sorted(countries, key=sort_key)
+        # Translating and sorting the countries is relatively expensive, so
+        # the results are cached per language (and for the current options
+        # that affect the ordering).
+        first_sort = self.get_option("first_sort")
+        first_break = self.get_option("first_break")
+        first_repeat = self.get_option("first_repeat")
+        cache_key = (get_language(), first_sort, first_break, first_repeat)
+        results = self._iter_cache.get(cache_key)
+        if results is None:
+            results = []
+
+            # Add countries that should be displayed first.
+            countries_first = [
+                self.translate_pair(code) for code in self.countries_first
+            ]
+            if first_sort:
+                countries_first.sort(key=sort_key)
+            results.extend(countries_first)
+
+            if self.countries_first and first_break:
+                results.append(CountryTuple("", force_str(first_break)))
+
+            # Force translation before sorting.
+            ignore_first = None if first_repeat else set(self.countries_first)
+            countries_translated: List[CountryTuple] = []
+            for code in countries:
+                countries_translated.extend(self.translate_code(code, ignore_first))
+
+            # Add the sorted country list.
+            countries_translated.sort(key=sort_key)
+            results.extend(countries_translated)
+            self._iter_cache[cache_key] = results
+
+        return results
 
     def alpha2(self, code: CountryCode) -> str:
         """
@@ -376,28 +459,25 @@ class Countries(CountriesBase):
 
         If no match is found, returns an empty string.
         """
-        find: Optional[Callable]
-        code_str = force_str(code).upper()
-        if code_str.isdigit():
-            lookup_numeric = int(code_str)
-
-            def find(alt_codes):
-                return alt_codes[1] == lookup_numeric
-
-        elif len(code_str) == 3:
-            lookup_alpha3 = code_str
-
-            def find(alt_codes) -> bool:
-                return alt_codes[0] == lookup_alpha3
-
+        if (
+            isinstance(code, str)
+            and len(code) == 2
+            and code.isupper()
+            and code in self.countries
+        ):
+            # Already a normalized code.
+            return code
+        if isinstance(code, int):
+            # No need to go via a string for numeric codes.
+            code_str = self.numeric_index.get(code, "")
         else:
-            find = None
-        if find:
-            code_str = ""
-            for alpha2, alt_codes in self.alt_codes.items():
-                if find(alt_codes):
-                    code_str = alpha2
-                    break
+            if not isinstance(code, str):
+                code = force_str(code)
+            code_str = code.upper()
+            if code_str.isdigit():
+                code_str = self.numeric_index.get(int(code_str), "")
+            elif len(code_str) == 3:
+                code_str = self.alpha3_index.get(code_str, "")
         if code_str in self.countries:
             return code_str
         return ""
@@ -427,7 +507,7 @@ class Countries(CountriesBase):
     @overload
     def by_name(
         self,
-        country: str,
+        country: Union[str, Pattern[str]],
         *,
         regex: Literal[True],
         language: str = "en",
@@ -437,7 +517,7 @@ class Countries(CountriesBase):
 
     def by_name(
         self,
-        country: str,
+        country: Union[str, Pattern[str]],
         *,
         regex: bool = False,
         language: str = "en",
@@ -453,7 +533,9 @@ class Countries(CountriesBase):
 
         If ``regex`` is set to True, then rather than returning a string
         containing the matching country code or an empty string, a set of
-        matching country codes is returned.
+        matching country codes is returned. A precompiled regular expression
+        can also be passed in this case (its own flags are used, so
+        ``insensitive`` is ignored).
 
         If ``insensitive`` is set to False (True by default), then the search
         will be case sensitive.
@@ -462,44 +544,64 @@ class Countries(CountriesBase):
             (especially with any hard-coded string) since the ISO names of
             countries may change over time.
         """
-        code_list = set()
-        if regex:
+        if not regex:
+            if isinstance(country, re.Pattern):
+                raise TypeError("A compiled pattern requires regex=True")
+            if insensitive:
+                country = country.lower()
+            return self._name_index(language, insensitive).get(country, "")
+        if isinstance(country, re.Pattern):
+            re_match = country
+        else:
             re_match = re.compile(country, insensitive and re.IGNORECASE)
-        elif insensitive:
-            country = country.lower()
-        with override(language):
-            for code, check_country in self.countries.items():
-                if isinstance(check_country, dict):
-                    if "names" in check_country:
-                        check_names: "List[StrPromise]" = check_country["names"]
-                    else:
-                        check_names = [check_country["name"]]
-                else:
-                    check_names = [check_country]
-                for name in check_names:
-                    if regex:
-                        if re_match.search(str(name)):
-                            code_list.add(code)
-                    else:
-                        if insensitive:
-                            if country == name.lower():
-                                return code
-                        else:
-                            if country == name:
-                                return code
-                if code in self.shadowed_names:
-                    for shadowed_name in self.shadowed_names[code]:
-                        if regex:
-                            if re_match.search(str(shadowed_name)):
-                                code_list.add(code)
-                        else:
-                            if insensitive:
-                                shadowed_name = shadowed_name.lower()
-                            if country == shadowed_name:
-                                return code
-        if regex:
-            return code_list
-        return ""
+        return {code for code, name in self._names(language) if re_match.search(name)}
+
+    def _country_names(self, country: CountryName) -> "List[StrPromise]":
+        if isinstance(country, dict):
+            if "names" in country:
+                return country["names"]
+            return [country["name"]]
+        return [country]
+
+    def _names(self, language: str) -> List[Tuple[str, str]]:
+        """
+        Return a (cached) list of ``(code, name)`` pairs for every name
+        (including shadowed names) of each country, translated to the given
+        language.
+        """
+        # Ensure the countries (and names cache) have been built.
+        countries = self.countries
+        names = self._names_cache.get(language)
+        if names is None:
+            names = []
+            with override(language):
+                for code, country in countries.items():
+                    country_names = self._country_names(country)
+                    country_names = country_names + self.shadowed_names.get(code, [])
+                    for name in country_names:
+                        names.append((code, force_str(name)))
+            self._names_cache[language] = names
+        return names
+
+    def _name_index(self, language: str, insensitive: bool) -> Dict[str, str]:
+        """
+        Return a (cached) mapping of country names in the given language to
+        their country codes, used to look up countries by name.
+
+        Where more than one country shares a name, the first one wins.
+        """
+        # Ensure the countries (and name index cache) have been built.
+        self.countries
+        cache_key = (language, insensitive)
+        index = self._name_index_cache.get(cache_key)
+        if index is None:
+            index = {}
+            for code, name in self._names(language):
+                if insensitive:
+                    name = name.lower()
+                index.setdefault(name, code)
+            self._name_index_cache[cache_key] = index
+        return index
 
     def alpha3(self, code: CountryCode) -> str:
         """
@@ -584,12 +686,7 @@ class Countries(CountriesBase):
         Some applications expect to be able to access members of the field
         choices by index.
         """
-        try:
-            return next(itertools.islice(self.__iter__(), index, index + 1))
-        except TypeError:
-            return list(
-                itertools.islice(self.__iter__(), index.start, index.stop, index.step)
-            )
+        return self._sorted_list()[index]
 
 
 countries = Countries()
@@ -10,7 +10,7 @@ class AppSettings:
     """
 
     def __getattribute__(self, attr: str):
-        if attr == attr.upper():
+        if attr.isupper():
             try:
                 return getattr(django.conf.settings, attr)
             except AttributeError:
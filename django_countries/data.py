@@ -14,7 +14,6 @@ how to do that:
 7. Save as a CSV file in django_countries/iso3166-1.csv
 8. Run this script from the command line
 """
-import glob
 import os
 from typing import TYPE_CHECKING, Dict
 
@@ -551,10 +550,9 @@ def self_generate(
     import unicodedata
 
     countries = []
-    with open(filename) as csv_file:
+    with open(filename, encoding="utf-8", newline="") as csv_file:
         for row in csv.reader(csv_file):
-            name = row[0].rstrip("*")
-            name = re.sub(r"\(the\)", "", name)
+            name = row[0].rstrip("*").replace("(the)", "")
             name = re.sub(r" +\[(.+)\]", r" (\1)", name)
             if name:
                 countries.append((name, row[1], row[2], int(row[3])))
@@ -572,29 +570,29 @@ def self_generate(
 
     countries = sorted(countries, key=sort_key)
 
+    def escape_quotes(name: str) -> str:
+        return name.replace('"', r"\"")
+
     # Write countries.
     match = re.match(r"(.*\nCOUNTRIES = \{\n)(.*?)(\n\}.*)", contents, re.DOTALL)
     if not match:
         raise ValueError('Expected a "COUNTRIES =" section in the source file!')
     bits = match.groups()
-    country_list = []
-    for country_row in countries:
-        name = country_row[0].replace('"', r"\"").strip()
-        country_list.append(f'    "{country_row[1]}": _("{name}"),')
     content = bits[0]
-    content += "\n".join(country_list)
+    content += "\n".join(
+        f'    "{code}": _("{escape_quotes(name.strip())}"),'
+        for name, code, _alpha3, _numeric in countries
+    )
     # Write alt codes.
     alt_match = re.match(r"(.*\nALT_CODES = \{\n)(.*)(\n\}.*)", bits[2], re.DOTALL)
     if not alt_match:
         raise ValueError('Expected an "ALT_CODES =" section in the source file!')
     alt_bits = alt_match.groups()
-    alt_list = []
-    for country_row in countries:
-        alt_list.append(
-            f'    "{country_row[1]}": ("{country_row[2]}", {country_row[3]}),'
-        )
     content += alt_bits[0]
-    content += "\n".join(alt_list)
+    content += "\n".join(
+        f'    "{code}": ("{alpha3}", {numeric}),'
+        for _name, code, alpha3, numeric in countries
+    )
     content += alt_bits[2]
     # Generate file.
     with open(output_filename, "w") as output_file:
@@ -605,10 +603,12 @@ def self_generate(
 def check_flags(verbosity: int = 1):
     files = {}
     this_dir = os.path.dirname(__file__)
-    for path in glob.glob(os.path.join(this_dir, "static", "flags", "*.gif")):
-        files[os.path.basename(os.path.splitext(path)[0]).upper()] = path
+    with os.scandir(os.path.join(this_dir, "static", "flags")) as entries:
+        for entry in entries:
+            if entry.name.endswith(".gif"):
+                files[entry.name[:-4].upper()] = entry.path
 
-    flags_missing = set(COUNTRIES) - set(files)
+    flags_missing = COUNTRIES.keys() - files.keys()
     if flags_missing:  # pragma: no cover
         print("The following country codes are missing a flag:")
         for code in sorted(flags_missing):
@@ -616,10 +616,8 @@ def check_flags(verbosity: int = 1):
     elif verbosity:  # pragma: no cover
         print("All country codes have flags. :)")
 
-    code_missing = set(files) - set(COUNTRIES)
     # Special-case EU and __
-    for special_code in ("EU", "__"):
-        code_missing.discard(special_code)
+    code_missing = files.keys() - COUNTRIES.keys() - {"EU", "__"}
     if code_missing:  # pragma: no cover
         print("")
         print("The following flags don't have a matching country code:")
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from django.test import TestCase
 from django.utils import translation
@@ -61,9 +63,21 @@ class TestCountriesObject(BaseTest):
     def test_countries_getitem(self):
         countries[0]
 
+    def test_countries_getitem_index(self):
+        self.assertEqual(countries[1], FIRST_THREE_COUNTRIES[1])
+        self.assertEqual(countries[-1], ("ZW", "Zimbabwe"))
+        with self.assertRaises(IndexError):
+            countries[EXPECTED_COUNTRY_COUNT]
+
     def test_countries_slice(self):
         sliced = countries[10:20:2]
         self.assertEqual(len(sliced), 5)
+        self.assertEqual(countries[:3], FIRST_THREE_COUNTRIES)
+        self.assertEqual(countries[-1:], [("ZW", "Zimbabwe")])
+
+    def test_countries_slice_copy(self):
+        countries[:3].clear()
+        self.assertEqual(countries[:3], FIRST_THREE_COUNTRIES)
 
     def test_countries_custom_gettext_evaluation(self):
         class FakeLazyGetText:
@@ -82,6 +96,19 @@ class TestCountriesObject(BaseTest):
         # Use a new instance so nothing is cached
         dict(Countries())
 
+    @pytest.mark.skipif(not settings.USE_I18N, reason="No i18n")
+    def test_iter_cached_per_language(self):
+        self.assertEqual(dict(countries)["DE"], "Germany")
+        with translation.override("de"):
+            self.assertEqual(dict(countries)["DE"], "Deutschland")
+        self.assertEqual(dict(countries)["DE"], "Germany")
+
+    def test_iter_cache_reset(self):
+        list(countries)
+        with self.settings(COUNTRIES_OVERRIDE={"NZ": "Middle Earth"}):
+            del countries.countries
+            self.assertEqual(dict(countries)["NZ"], "Middle Earth")
+
     def test_flags(self):
         from ..data import check_flags
 
@@ -140,6 +167,18 @@ class TestCountriesObject(BaseTest):
             self.assertEqual(countries.numeric("NZ"), None)
             self.assertEqual(countries.numeric("US"), 900)
 
+    def test_alpha2_override_alt_codes(self):
+        with self.settings(
+            COUNTRIES_OVERRIDE={
+                "XX": {"name": "Neverland", "alpha3": "XXX", "numeric": 900},
+                "NZ": {"numeric": None},
+            }
+        ):
+            self.assertEqual(countries.alpha2("xxx"), "XX")
+            self.assertEqual(countries.alpha2(900), "XX")
+            self.assertEqual(countries.alpha2("NZL"), "NZ")
+            self.assertEqual(countries.alpha2(554), "")
+
     def test_alpha2_override_new(self):
         with self.settings(COUNTRIES_OVERRIDE={"XX": "Neverland"}):
             self.assertEqual(countries.alpha2("XX"), "XX")
@@ -199,6 +238,11 @@ class TestCountriesObject(BaseTest):
         code = countries.by_name("bRuNeI")
         self.assertEqual(code, "BN")
 
+    def test_fetch_by_name_case_sensitive(self):
+        self.assertEqual(countries.by_name("Brunei", insensitive=False), "BN")
+        self.assertEqual(countries.by_name("bRuNeI", insensitive=False), "")
+        self.assertEqual(countries.by_name("Turkey", insensitive=False), "TR")
+
     def test_fetch_by_name_old(self):
         code = countries.by_name("Czech Republic")
         self.assertEqual(code, "CZ")
@@ -211,6 +255,7 @@ class TestCountriesObject(BaseTest):
     def test_fetch_by_name_i18n(self):
         code = countries.by_name("Estados Unidos", language="es")
         self.assertEqual(code, "US")
+        self.assertEqual(countries.by_name("Estados Unidos"), "")
 
     def test_fetch_by_name_no_match(self):
         self.assertEqual(countries.by_name("Neverland"), "")
@@ -231,6 +276,21 @@ class TestCountriesObject(BaseTest):
         # Cook Islands, Cameroon, Sint Maarten
         self.assertEqual(set(codes), {"CK", "CM", "SX"})
 
+    def test_fetch_by_name_regex_compiled(self):
+        pattern = re.compile("^New ")
+        self.assertEqual(countries.by_name(pattern, regex=True), {"NC", "NZ"})
+        self.assertEqual(countries.by_name(re.compile("^new "), regex=True), set())
+
+    def test_fetch_by_name_compiled_without_regex(self):
+        with self.assertRaises(TypeError):
+            countries.by_name(re.compile("^New "))
+
+    def test_fetch_by_name_regex_shadowed(self):
+        self.assertEqual(countries.by_name("^czech", regex=True), {"CZ"})
+        self.assertEqual(
+            countries.by_name("^czech", regex=True, insensitive=False), set()
+        )
+
     def test_multiple_labels(self):
         with self.settings(
             COUNTRIES_ONLY={
@@ -259,6 +319,12 @@ class CountriesFirstTest(BaseTest):
                 [("NZ", "New Zealand"), ("AU", "Australia")] + FIRST_THREE_COUNTRIES,
             )
 
+    def test_countries_first_alt_codes(self):
+        with self.settings(COUNTRIES_FIRST=["NZL", 36]):
+            self.assertEqual(
+                list(countries)[:2], [("NZ", "New Zealand"), ("AU", "Australia")]
+            )
+
     def test_countries_first_break(self):
         with self.settings(
             COUNTRIES_FIRST=["NZ", "AU"], COUNTRIES_FIRST_BREAK="------"
@@ -269,6 +335,12 @@ class CountriesFirstTest(BaseTest):
                 + FIRST_THREE_COUNTRIES,
             )
 
+    def test_countries_first_break_changed(self):
+        with self.settings(COUNTRIES_FIRST=["NZ", "AU"]):
+            self.assertEqual(list(countries)[2], FIRST_THREE_COUNTRIES[0])
+            with self.settings(COUNTRIES_FIRST_BREAK="------"):
+                self.assertEqual(list(countries)[2], ("", "------"))
+
     def test_countries_first_some_valid(self):
         with self.settings(
             COUNTRIES_FIRST=["XX", "NZ", "AU"], COUNTRIES_FIRST_BREAK="------"